@@ -1,10 +1,41 @@
 #!/usr/bin/env python3
-"""Generate rich sample data for streamatrix.live experiments."""
+"""Generate rich sample data for streamatrix.live experiments.
+
+The generator only needs the standard library and runs on CPython or PyPy;
+scripts/generate_sample_data_pypy.sh picks PyPy when it is installed. On
+CPython, orjson is used for serialization if available. Under PyPy the stdlib
+json module is used instead, since orjson would go through cpyext.
+"""
+import argparse
+import io
+import itertools
 import json
+import os
+import platform
 import random
+import sys
+import tarfile
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+orjson = None
+if platform.python_implementation() != "PyPy":
+    try:
+        import orjson
+    except ImportError:
+        pass
+
+try:
+    from itertools import batched
+except ImportError:  # Python < 3.12
+
+    def batched(iterable: Iterable[Any], n: int) -> Iterator[Tuple[Any, ...]]:
+        iterator = iter(iterable)
+        while chunk := tuple(itertools.islice(iterator, n)):
+            yield chunk
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_ROOT = ROOT / "data"
@@ -12,6 +43,8 @@ PROVIDERS_DIR = DATA_ROOT / "providers"
 EVENTS_DIR = DATA_ROOT / "events"
 PLAYLISTS_DIR = DATA_ROOT / "playlists"
 DOCS_DIR = ROOT / "docs" / "datasets"
+ARCHIVE_PATH = DATA_ROOT / "fixtures.tar"
+BASE_TIME = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
 
 random.seed(42)
 
@@ -32,6 +65,7 @@ SPORTS = [
     "cycling-world-tour",
     "esports-league"
 ]
+SPORTS = [sys.intern(sport) for sport in SPORTS]
 
 COUNTRIES = [
     "us",
@@ -65,6 +99,10 @@ LANGUAGES = [
     "hi"
 ]
 
+SPORTS_SORTED = sorted(SPORTS)
+COUNTRIES_SORTED = sorted(COUNTRIES)
+LANGUAGES_SORTED = sorted(LANGUAGES)
+
 CDNS = [
     "akamai",
     "cloudfront",
@@ -79,6 +117,36 @@ PROTOCOLS = [
     ("webrtc", "sdp")
 ]
 
+AUTH_TYPES = (
+    "signed-url",
+    "token",
+    "mutual-tls"
+)
+
+TTL_SECONDS = (
+    900,
+    1800,
+    3600
+)
+
+LATENCY_CLASSES = (
+    "ultra-low",
+    "low",
+    "standard"
+)
+
+OBSERVABILITY_VENDORS = (
+    "newrelic",
+    "datadog",
+    "grafana"
+)
+
+ON_CALL_MODELS = (
+    "follow-the-sun",
+    "regional-escalation",
+    "hybrid"
+)
+
 PREFIXES = [
     "Global",
     "Velocity",
@@ -205,79 +273,192 @@ EVENT_NAME_SETS = {
         "Showmatch"
     ]
 }
-def create_directories() -> None:
-    for directory in [PROVIDERS_DIR, EVENTS_DIR, PLAYLISTS_DIR, DOCS_DIR]:
+EVENT_NAME_SETS = {sys.intern(sport): titles for sport, titles in EVENT_NAME_SETS.items()}
+TITLES_PER_SPORT = len(EVENT_NAME_SETS[SPORTS[0]])
+assert all(len(titles) == TITLES_PER_SPORT for titles in EVENT_NAME_SETS.values()), (
+    "every EVENT_NAME_SETS entry must list the same number of titles"
+)
+
+VENUES = (
+    "Metropolitan Arena",
+    "Coastal Dome",
+    "Summit Stadium",
+    "Heritage Park",
+    "Aurora Center",
+    "Prime Pavilion",
+    "Velocity Arena",
+    "Union Ground",
+    "Liberty Field",
+    "Grand Prix Circuit"
+)
+
+TIMEZONES = (
+    "UTC",
+    "America/New_York",
+    "Europe/London",
+    "Asia/Singapore",
+    "Australia/Sydney"
+)
+
+NOTES_POOL = (
+    "4K SDR primary feed",
+    "Dolby Atmos mix available",
+    "Alternate commentary lane",
+    "Player-specific iso cams",
+    "Enhanced data overlays enabled",
+    "VR companion experience"
+)
+
+CURATORS = (
+    "editorial-team",
+    "automation-playbook",
+    "regional-scouts",
+    "audience-growth"
+)
+
+# (protocol, auth type, TTL, ingest region, latency class, observability) indices
+EndpointIndices = Tuple[int, int, int, int, int, int]
+
+
+class ProviderDraws(NamedTuple):
+    focus: List[List[int]]
+    countries: List[List[int]]
+    languages: List[List[int]]
+    endpoints: List[List[EndpointIndices]]
+    cdn: List[int]
+    on_call: List[int]
+
+
+def create_directories(archive: bool = False) -> None:
+    directories = [DATA_ROOT, DOCS_DIR] if archive else [PROVIDERS_DIR, EVENTS_DIR, PLAYLISTS_DIR, DOCS_DIR]
+    for directory in directories:
         directory.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=None)
 def format_timestamp(days_in_future: int, hour: int) -> str:
-    base = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
-    target = base + timedelta(days=days_in_future)
+    target = BASE_TIME + timedelta(days=days_in_future)
     return target.replace(hour=hour).isoformat() + "Z"
 
 
+def compute_windows(
+    day_offsets: Sequence[int], start_hours: Sequence[int], durations: Sequence[int]
+) -> List[Tuple[str, str]]:
+    windows: List[Tuple[str, str]] = []
+    for day_offset, start_hour, duration in zip(day_offsets, start_hours, durations):
+        end_day_delta, end_hour = divmod(start_hour + duration, 24)
+        windows.append(
+            (
+                format_timestamp(days_in_future=day_offset, hour=start_hour),
+                format_timestamp(days_in_future=day_offset + end_day_delta, hour=end_hour),
+            )
+        )
+    return windows
+
+
+def draw_index_sets(size: int, counts: Sequence[int]) -> List[List[int]]:
+    population = range(size)
+    return [sorted(random.sample(population, k)) for k in counts]
+
+
+def draw_provider_indices(count: int) -> ProviderDraws:
+    focus_ix = draw_index_sets(len(SPORTS_SORTED), random.choices(range(2, 6), k=count))
+    country_ix = draw_index_sets(len(COUNTRIES_SORTED), random.choices(range(2, 6), k=count))
+    language_ix = draw_index_sets(len(LANGUAGES_SORTED), random.choices(range(1, 4), k=count))
+    endpoint_counts = random.choices(range(1, len(PROTOCOLS) + 1), k=count)
+    total_endpoints = sum(endpoint_counts)
+    auth_ix = random.choices(range(len(AUTH_TYPES)), k=total_endpoints)
+    ttl_ix = random.choices(range(len(TTL_SECONDS)), k=total_endpoints)
+    latency_ix = random.choices(range(len(LATENCY_CLASSES)), k=total_endpoints)
+    observability_ix = random.choices(range(len(OBSERVABILITY_VENDORS)), k=total_endpoints)
+
+    endpoint_ix: List[List[EndpointIndices]] = []
+    offset = 0
+    for countries, k in zip(country_ix, endpoint_counts):
+        window = slice(offset, offset + k)
+        offset += k
+        endpoint_ix.append(
+            list(
+                zip(
+                    random.sample(range(len(PROTOCOLS)), k),
+                    auth_ix[window],
+                    ttl_ix[window],
+                    random.choices(countries, k=k),
+                    latency_ix[window],
+                    observability_ix[window],
+                )
+            )
+        )
+
+    cdn_ix = random.choices(range(len(CDNS)), k=count)
+    on_call_ix = random.choices(range(len(ON_CALL_MODELS)), k=count)
+    return ProviderDraws(
+        focus=focus_ix,
+        countries=country_ix,
+        languages=language_ix,
+        endpoints=endpoint_ix,
+        cdn=cdn_ix,
+        on_call=on_call_ix,
+    )
+
+
 def generate_providers(count: int = 60) -> List[Dict[str, Any]]:
     providers: List[Dict[str, Any]] = []
-    seen_names = set()
+    name_pool = list(itertools.product(PREFIXES, REGIONAL_DESCRIPTORS, SUFFIXES))
+    random.shuffle(name_pool)
+
+    draws = draw_provider_indices(count)
 
-    for idx in range(1, count + 1):
-        prefix = random.choice(PREFIXES)
-        region = random.choice(REGIONAL_DESCRIPTORS)
-        suffix = random.choice(SUFFIXES)
+    for i in range(count):
+        idx = i + 1
+        prefix, region, suffix = name_pool[i]
         name_candidate = f"{prefix} {region} {suffix}"
-        while name_candidate in seen_names:
-            prefix = random.choice(PREFIXES)
-            region = random.choice(REGIONAL_DESCRIPTORS)
-            suffix = random.choice(SUFFIXES)
-            name_candidate = f"{prefix} {region} {suffix}"
-        seen_names.add(name_candidate)
 
         provider_id = f"provider-{idx:03d}"
-        focus_count = random.randint(2, 5)
-        focus = random.sample(SPORTS, focus_count)
-        countries = random.sample(COUNTRIES, random.randint(2, 5))
-        languages = random.sample(LANGUAGES, random.randint(1, 3))
-        cdn = random.choice(CDNS)
+        focus = [SPORTS_SORTED[j] for j in draws.focus[i]]
+        countries = [COUNTRIES_SORTED[j] for j in draws.countries[i]]
+        languages = [LANGUAGES_SORTED[j] for j in draws.languages[i]]
+        stream_base = f"https://streams.example.com/{provider_id}"
+        status_base = f"https://status.example.com/{provider_id}"
 
         endpoints = []
-        for protocol, extension in random.sample(PROTOCOLS, random.randint(1, len(PROTOCOLS))):
+        for protocol_j, auth_j, ttl_j, region_j, latency_j, observability_j in draws.endpoints[i]:
+            protocol, extension = PROTOCOLS[protocol_j]
             stream_key = f"{provider_id}-{protocol}"
             endpoints.append(
                 {
                     "protocol": protocol,
-                    "url": f"https://streams.example.com/{provider_id}/{protocol}/master.{extension}",
+                    "url": f"{stream_base}/{protocol}/master.{extension}",
                     "auth": {
-                        "type": random.choice(["signed-url", "token", "mutual-tls"]),
-                        "ttlSeconds": random.choice([900, 1800, 3600]),
+                        "type": AUTH_TYPES[auth_j],
+                        "ttlSeconds": TTL_SECONDS[ttl_j],
                     },
                     "ingest": {
-                        "region": random.choice(countries),
-                        "latencyClass": random.choice(["ultra-low", "low", "standard"]),
+                        "region": COUNTRIES_SORTED[region_j],
+                        "latencyClass": LATENCY_CLASSES[latency_j],
                     },
                     "monitoring": {
-                        "healthcheck": f"https://status.example.com/{provider_id}/{protocol}",
-                        "observability": random.choice(["newrelic", "datadog", "grafana"]),
+                        "healthcheck": f"{status_base}/{protocol}",
+                        "observability": OBSERVABILITY_VENDORS[observability_j],
                     },
                     "streamKey": stream_key,
                 }
             )
 
-        support = {
-            "statusPage": f"https://status.example.com/{provider_id}",
-            "contact": f"support@{provider_id}.example.com",
-            "onCall": random.choice(["follow-the-sun", "regional-escalation", "hybrid"]),
-        }
-
         providers.append(
             {
                 "id": provider_id,
                 "name": name_candidate,
-                "focus": sorted(focus),
-                "countries": sorted(countries),
-                "languages": sorted(languages),
-                "cdn": cdn,
-                "endpoints": endpoints,
-                "support": support,
+                "sportsFocus": focus,
+                "coverageCountries": countries,
+                "supportedLanguages": languages,
+                "primaryCdn": CDNS[draws.cdn[i]],
+                "activeEndpoints": endpoints,
+                "supportModel": {
+                    "statusPage": status_base,
+                    "contact": f"support@{provider_id}.example.com",
+                    "onCall": ON_CALL_MODELS[draws.on_call[i]],
+                },
             }
         )
     return providers
@@ -285,56 +466,39 @@ def generate_providers(count: int = 60) -> List[Dict[str, Any]]:
 
 def generate_events(providers: List[Dict[str, Any]], count: int = 90) -> List[Dict[str, Any]]:
     events: List[Dict[str, Any]] = []
-    for idx in range(1, count + 1):
-        sport = random.choice(SPORTS)
-        titles = EVENT_NAME_SETS[sport]
-        descriptor = random.choice(titles)
+    provider_ids = [provider["id"] for provider in providers]
+    sports = random.choices(SPORTS, k=count)
+    descriptor_ix = random.choices(range(TITLES_PER_SPORT), k=count)
+    start_hours = random.choices([12, 15, 18, 20, 22], k=count)
+    day_offsets = random.choices(range(1, 91), k=count)
+    durations = random.choices([2, 3, 4], k=count)
+    venues = random.choices(VENUES, k=count)
+    timezones = random.choices(TIMEZONES, k=count)
+    windows = compute_windows(day_offsets, start_hours, durations)
+    provider_counts = random.choices(range(2, 5), k=count)
+    note_counts = random.choices(range(2, 5), k=count)
+
+    for i in range(count):
+        idx = i + 1
+        sport = sports[i]
+        descriptor = EVENT_NAME_SETS[sport][descriptor_ix[i]]
         event_id = f"event-{idx:03d}-{sport}"
-        start_hour = random.choice([12, 15, 18, 20, 22])
-        day_offset = random.randint(1, 90)
-        duration = random.choice([2, 3, 4])
-        end_hour_total = start_hour + duration
-        end_day_offset = day_offset + end_hour_total // 24
-        end_hour = end_hour_total % 24
-        start = format_timestamp(days_in_future=day_offset, hour=start_hour)
-        end = format_timestamp(days_in_future=end_day_offset, hour=end_hour)
-        venue = random.choice([
-            "Metropolitan Arena",
-            "Coastal Dome",
-            "Summit Stadium",
-            "Heritage Park",
-            "Aurora Center",
-            "Prime Pavilion",
-            "Velocity Arena",
-            "Union Ground",
-            "Liberty Field",
-            "Grand Prix Circuit"
-        ])
-        timezone = random.choice(["UTC", "America/New_York", "Europe/London", "Asia/Singapore", "Australia/Sydney"])
-        providers_sample = random.sample(providers, k=random.randint(2, 4))
-        providers_ids = [provider["id"] for provider in providers_sample]
-        notes = [
-            random.choice([
-                "4K SDR primary feed",
-                "Dolby Atmos mix available",
-                "Alternate commentary lane",
-                "Player-specific iso cams",
-                "Enhanced data overlays enabled",
-                "VR companion experience",
-            ])
-            for _ in range(random.randint(2, 4))
-        ]
+        start, end = windows[i]
+        providers_ids = random.sample(provider_ids, k=provider_counts[i])
+        notes = random.choices(NOTES_POOL, k=note_counts[i])
         events.append(
             {
                 "id": event_id,
                 "sport": sport,
                 "title": f"{sport.replace('-', ' ').title()} {descriptor}",
-                "start": start,
-                "end": end,
-                "venue": venue,
-                "timezone": timezone,
-                "providers": providers_ids,
-                "notes": notes,
+                "window": {
+                    "start": start,
+                    "end": end,
+                    "timezone": timezones[i],
+                },
+                "venue": venues[i],
+                "availableProviders": providers_ids,
+                "presentationNotes": notes,
             }
         )
     return events
@@ -342,24 +506,18 @@ def generate_events(providers: List[Dict[str, Any]], count: int = 90) -> List[Di
 
 def generate_playlists(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     playlists: List[Dict[str, Any]] = []
-    events_by_sport: Dict[str, List[Dict[str, Any]]] = {}
+    event_ids_by_sport: Dict[str, List[str]] = {}
     for event in events:
-        events_by_sport.setdefault(event["sport"], []).append(event)
+        event_ids_by_sport.setdefault(event["sport"], []).append(event["id"])
 
     playlist_idx = 1
-    for sport, sport_events in events_by_sport.items():
-        random.shuffle(sport_events)
-        chunks = [sport_events[i : i + 5] for i in range(0, len(sport_events), 5)]
-        for chunk in chunks:
+    for sport, sport_event_ids in event_ids_by_sport.items():
+        random.shuffle(sport_event_ids)
+        for chunk_ids in batched(sport_event_ids, 5):
             playlist_id = f"playlist-{playlist_idx:03d}-{sport}"
             playlist_idx += 1
             title = f"{sport.replace('-', ' ').title()} Weekly Mix #{playlist_idx:02d}"
-            curator = random.choice([
-                "editorial-team",
-                "automation-playbook",
-                "regional-scouts",
-                "audience-growth"
-            ])
+            curator = random.choice(CURATORS)
             weeks = [f"2025-W{random.randint(1, 52):02d}" for _ in range(random.randint(2, 4))]
             playlists.append(
                 {
@@ -367,67 +525,69 @@ def generate_playlists(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
                     "sport": sport,
                     "title": title,
                     "curator": curator,
-                    "weeks": sorted(set(weeks)),
-                    "events": [event["id"] for event in chunk],
+                    "targetWeeks": sorted(set(weeks)),
+                    "events": list(chunk_ids),
                 }
             )
     return playlists
 
 
+def dumps_json(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+
+
 def write_json(path: Path, payload: dict) -> None:
-    path.write_text(json.dumps(payload, indent=2) + "\n")
+    if orjson is None and not path.exists():
+        with path.open("w", encoding="utf-8") as fp:
+            json.dump(payload, fp, indent=2)
+            fp.write("\n")
+        return
+    data = dumps_json(payload)
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+
+
+def remove_stale_files(directory: Path, records: List[Dict[str, Any]]) -> None:
+    expected = {f"{record['id']}.json" for record in records}
+    for path in directory.glob("*.json"):
+        if path.name not in expected:
+            path.unlink()
+
+
+def write_providers(executor: Executor, providers: List[Dict[str, Any]]) -> List[Future]:
+    return [
+        executor.submit(write_json, PROVIDERS_DIR / f"{provider['id']}.json", provider)
+        for provider in providers
+    ]
 
 
-def write_providers(providers: List[Dict[str, Any]]) -> None:
-    for provider in providers:
-        write_json(
-            PROVIDERS_DIR / f"{provider['id']}.json",
-            {
-                "id": provider["id"],
-                "name": provider["name"],
-                "sportsFocus": provider["focus"],
-                "coverageCountries": provider["countries"],
-                "supportedLanguages": provider["languages"],
-                "primaryCdn": provider["cdn"],
-                "activeEndpoints": provider["endpoints"],
-                "supportModel": provider["support"],
-            },
-        )
+def write_events(executor: Executor, events: List[Dict[str, Any]]) -> List[Future]:
+    return [executor.submit(write_json, EVENTS_DIR / f"{event['id']}.json", event) for event in events]
 
 
-def write_events(events: List[Dict[str, Any]]) -> None:
-    for event in events:
-        write_json(
-            EVENTS_DIR / f"{event['id']}.json",
-            {
-                "id": event["id"],
-                "sport": event["sport"],
-                "title": event["title"],
-                "window": {
-                    "start": event["start"],
-                    "end": event["end"],
-                    "timezone": event["timezone"],
-                },
-                "venue": event["venue"],
-                "availableProviders": event["providers"],
-                "presentationNotes": event["notes"],
-            },
-        )
+def write_playlists(executor: Executor, playlists: List[Dict[str, Any]]) -> List[Future]:
+    return [
+        executor.submit(write_json, PLAYLISTS_DIR / f"{playlist['id']}.json", playlist)
+        for playlist in playlists
+    ]
 
 
-def write_playlists(playlists: List[Dict[str, Any]]) -> None:
-    for playlist in playlists:
-        write_json(
-            PLAYLISTS_DIR / f"{playlist['id']}.json",
-            {
-                "id": playlist["id"],
-                "sport": playlist["sport"],
-                "title": playlist["title"],
-                "curator": playlist["curator"],
-                "targetWeeks": playlist["weeks"],
-                "events": playlist["events"],
-            },
-        )
+def write_archive(
+    path: Path, providers: List[Dict[str, Any]], events: List[Dict[str, Any]], playlists: List[Dict[str, Any]]
+) -> None:
+    with tarfile.open(path, "w") as archive:
+        for directory, records in ((PROVIDERS_DIR, providers), (EVENTS_DIR, events), (PLAYLISTS_DIR, playlists)):
+            for record in records:
+                data = dumps_json(record)
+                info = tarfile.TarInfo(f"{directory.name}/{record['id']}.json")
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
 
 
 def write_docs(providers: List[Dict[str, Any]], events: List[Dict[str, Any]], playlists: List[Dict[str, Any]]) -> None:
@@ -445,16 +605,17 @@ def write_docs(providers: List[Dict[str, Any]], events: List[Dict[str, Any]], pl
     )
 
     providers_doc = DOCS_DIR / "providers.md"
-    top_providers = sorted(providers, key=lambda p: len(p["focus"]), reverse=True)[:10]
-    providers_lines = ["# Provider Highlights", ""]
+    top_providers = sorted(providers, key=lambda p: len(p["sportsFocus"]), reverse=True)[:10]
+    sections = ["# Provider Highlights\n"]
     for provider in top_providers:
-        providers_lines.append(f"## {provider['name']}")
-        providers_lines.append("- Sports focus: " + ", ".join(provider["focus"]))
-        providers_lines.append("- Coverage regions: " + ", ".join(provider["countries"]))
-        providers_lines.append("- Languages: " + ", ".join(provider["languages"]))
-        providers_lines.append("- Primary CDN: " + provider["cdn"])
-        providers_lines.append("")
-    providers_doc.write_text("\n".join(providers_lines) + "\n")
+        sections.append(
+            f"## {provider['name']}\n"
+            f"- Sports focus: {', '.join(provider['sportsFocus'])}\n"
+            f"- Coverage regions: {', '.join(provider['coverageCountries'])}\n"
+            f"- Languages: {', '.join(provider['supportedLanguages'])}\n"
+            f"- Primary CDN: {provider['primaryCdn']}\n"
+        )
+    providers_doc.write_text("\n".join(sections) + "\n")
 
     quality_doc = DOCS_DIR / "validation-playbook.md"
     quality_doc.write_text(
@@ -472,21 +633,41 @@ def write_docs(providers: List[Dict[str, Any]], events: List[Dict[str, Any]], pl
     )
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help=f"write all records into {ARCHIVE_PATH.relative_to(ROOT)} instead of one JSON file each",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
-    create_directories()
+    args = parse_args()
+    create_directories(archive=args.archive)
     providers = generate_providers()
     events = generate_events(providers)
     playlists = generate_playlists(events)
-    write_providers(providers)
-    write_events(events)
-    write_playlists(playlists)
+    if args.archive:
+        write_archive(ARCHIVE_PATH, providers, events, playlists)
+    else:
+        for directory, records in ((PROVIDERS_DIR, providers), (EVENTS_DIR, events), (PLAYLISTS_DIR, playlists)):
+            remove_stale_files(directory, records)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            futures = write_providers(executor, providers)
+            futures += write_events(executor, events)
+            futures += write_playlists(executor, playlists)
+            wait(futures)
+        for future in futures:
+            future.result()
     write_docs(providers, events, playlists)
     summary = {
         "providers": len(providers),
         "events": len(events),
         "playlists": len(playlists),
     }
-    print(json.dumps(summary, indent=2))
+    print(dumps_json(summary).decode("utf-8"), end="")
 
 
 if __name__ == "__main__":